@@ -11,7 +11,6 @@ from automata.core.agent.action import AutomataActionExtractor
 from automata.core.utils import config_fpath, get_logging_config
 
 logger = logging.getLogger(__name__)
-logging.config.dictConfig(get_logging_config())
 
 # Define the JSON schema for your YAML configuration files
 yaml_schema = {
@@ -89,6 +88,8 @@ def test_action_extraction(file_path) -> None:
 
 
 if __name__ == "__main__":
+    logging.config.dictConfig(get_logging_config())
+
     # Find all .yaml files in the specified directory
     yaml_files = glob.glob(os.path.join(config_fpath(), ConfigCategory.AGENT.value, "*.yaml"))
 
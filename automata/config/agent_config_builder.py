@@ -216,10 +216,8 @@ def build_agent_message(agent_configs: Dict[AgentConfigName, AutomataAgentConfig
         str: The generated message.
     """
     return "".join(
-        [
-            f"\n{main_config.config_name.value}: {main_config.description}\n"
-            for main_config in agent_configs.values()
-        ]
+        f"\n{main_config.config_name.value}: {main_config.description}\n"
+        for main_config in agent_configs.values()
     )
 
 
@@ -8,6 +8,8 @@ from pydantic import BaseModel
 
 from automata.core.base.tool import Toolkit, ToolkitType
 
+_CONFIG_DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
 
 class ConfigCategory(Enum):
     """
@@ -152,9 +154,8 @@ class AutomataAgentConfig(BaseModel):
         Returns:
             Dict: The loaded yaml config.
         """
-        file_dir_path = os.path.dirname(os.path.abspath(__file__))
         config_abs_path = os.path.join(
-            file_dir_path, ConfigCategory.AGENT.value, f"{config_name.value}.yaml"
+            _CONFIG_DIR_PATH, ConfigCategory.AGENT.value, f"{config_name.value}.yaml"
         )
 
         with open(config_abs_path, "r") as file:
@@ -179,11 +180,9 @@ class AutomataAgentConfig(BaseModel):
             str: A formatted string containing the names and descriptions of all available tools.
         """
         return "Tools:\n" + "".join(
-            [
-                f"\n{tool.name}:\n{tool.description}\n"
-                for toolkit in self.llm_toolkits.values()
-                for tool in toolkit.tools
-            ]
+            f"\n{tool.name}:\n{tool.description}\n"
+            for toolkit in self.llm_toolkits.values()
+            for tool in toolkit.tools
         )
 
     def _formatted_prompt(self) -> str:
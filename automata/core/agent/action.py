@@ -1,3 +1,4 @@
+import sys
 import textwrap
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
@@ -13,7 +14,23 @@ from .agent_enums import (
 )
 
 
+def _payload(line: str, sep: str = ActionIndicator.ACTION.value) -> str:
+    """
+    Extracts the payload following the action indicator on a line.
+
+    Args:
+        line (str): The line to extract the payload from.
+        sep (str): The action indicator separating prefix from payload.
+
+    Returns:
+        str: The stripped payload text.
+    """
+    return line.partition(sep)[2].strip()
+
+
 class Action(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -38,6 +55,8 @@ class Action(ABC):
 
 
 class ToolAction(Action):
+    __slots__ = ("tool_name", "tool_query", "tool_args")
+
     def __init__(self, tool_name: str, tool_query: str, tool_args: List[str]) -> None:
         """
         Initialize a ToolAction instance.
@@ -72,12 +91,16 @@ class ToolAction(Action):
         Returns:
             ToolAction: An instance of the ToolAction class.
         """
-        tool_query = lines[index].split(ActionIndicator.ACTION.value)[1].strip()
-        tool_name = lines[index + 2].split(ActionIndicator.ACTION.value)[1].strip()
+        tool_query = _payload(lines[index])
+        # Tool names come from a small closed set, so interning makes
+        # downstream comparisons and dict lookups pointer-cheap
+        tool_name = sys.intern(_payload(lines[index + 2]))
         return cls(tool_name, tool_query, [])
 
 
 class AgentAction(Action):
+    __slots__ = ("agent_version", "agent_query", "agent_instruction")
+
     def __init__(
         self,
         agent_version: AgentConfigName,
@@ -117,14 +140,14 @@ class AgentAction(Action):
         Returns:
             AgentAction: An instance of the AgentAction class.
         """
-        agent_query = lines[index].split(ActionIndicator.ACTION.value)[1].strip()
-        agent_version = AgentConfigName(
-            lines[index + 2].split(ActionIndicator.ACTION.value)[1].strip()
-        )
+        agent_query = _payload(lines[index])
+        agent_version = AgentConfigName(_payload(lines[index + 2]))
         return cls(agent_version, agent_query, [])
 
 
 class ResultAction(Action):
+    __slots__ = ("result_name", "result_outputs")
+
     def __init__(self, result_name: str, result_outputs: List[str]) -> None:
         """
         Initialize a ResultAction instance.
@@ -157,10 +180,8 @@ class ResultAction(Action):
         Returns:
             ResultAction: An instance of the ResultAction class.
         """
-        result_name = lines[index].split(ActionIndicator.ACTION.value)[1].strip()
-        result_outputs = lines[index + 1].split(ActionIndicator.ACTION.value)[
-            1
-        ].strip() + "\n".join(lines[index + 2 :])
+        result_name = sys.intern(_payload(lines[index]))
+        result_outputs = _payload(lines[index + 1]) + "\n".join(lines[index + 2 :])
         return cls(result_name, [result_outputs])
 
 
@@ -362,6 +383,5 @@ class AutomataActionExtractor:
                 is_code = False
                 inputs[-1] = textwrap.dedent(inputs[-1])
             elif ActionIndicator.ACTION.value in line:
-                clean_line = line.split(ActionIndicator.ACTION.value)[1].strip()
-                inputs.append(clean_line)
+                inputs.append(_payload(line))
         return (is_code, skip_lines)
@@ -21,6 +21,9 @@ from automata.core.utils import format_text, load_config, set_openai_api_key
 
 logger = logging.getLogger(__name__)
 
+# Log separator, built once instead of re-multiplied at each use
+_LOG_SEPARATOR = "-" * 60
+
 if TYPE_CHECKING:
     from automata.core.agent.coordinator import AutomataCoordinator
 
@@ -188,9 +191,9 @@ class AutomataAgent(Agent):
         logger.debug(
             "Initializing with System Instruction:%s\n\n" % self.config.system_instruction
         )
-        logger.debug("-" * 60)
+        logger.debug(_LOG_SEPARATOR)
         logger.debug(f"Session ID: {self.config.session_id}")
-        logger.debug("-" * 60)
+        logger.debug(_LOG_SEPARATOR)
 
     def _generate_observations(self, response_text: str) -> Dict[str, str]:
         """
@@ -8,6 +8,37 @@ from automata.core.coding.py_coding.retriever import PyCodeRetriever
 
 logger = logging.getLogger(__name__)
 
+# Tool descriptions are built once at import instead of on every build() call
+_RETRIEVE_CODE_DESCRIPTION = (
+    f"Returns the code of the python package, module, standalone function, class,"
+    f" or method at the given python path, without docstrings."
+    f' If no match is found, then "{NO_RESULT_FOUND_STR}" is returned.\n\n'
+    f'For example - suppose the function "my_function" is defined in the file "my_file.py" located in the main working directory,'
+    f"Then the correct tool input for the parser follows:\n"
+    f"  - tool_args\n"
+    f"    - my_file\n"
+    f"    - None\n"
+    f"    - my_function\n\n"
+    f"Suppose instead the file is located in a subdirectory called my_directory,"
+    f" then the correct tool input for the parser is:\n"
+    f"  - tool_args\n    - my_directory.my_file\n    - my_function\n\n"
+    f"Lastly, if the function is defined in a class, MyClass, then the correct tool input is:\n"
+    f"  - tool_args\n    - my_directory.my_file\n    - MyClass.my_function\n\n"
+)
+_RETRIEVE_CODE_BATCH_DESCRIPTION = (
+    "Identical to py-retriever-retrieve-code, except retrieves several objects from"
+    " the same module in one call. The first tool argument is the module path and each"
+    " subsequent argument is an object path within the module; the results are returned"
+    " in order, separated by newlines."
+)
+_RETRIEVE_DOCSTRING_DESCRIPTION = (
+    "Identical to py-retriever-retrieve-code, except returns the docstring instead of raw code."
+)
+_RETRIEVE_RAW_CODE_DESCRIPTION = (
+    "Identical to py-retriever-retrieve-code, except returns the raw text"
+    " (e.g. code + docstrings) of the module."
+)
+
 
 class PyCodeRetrieverTool(AgentTool):
     """
@@ -43,34 +74,30 @@ class PyCodeRetrieverTool(AgentTool):
             Tool(
                 name="py-retriever-retrieve-code",
                 func=lambda query: self._run_indexer_retrieve_code(*query),
-                description=f"Returns the code of the python package, module, standalone function, class,"
-                f" or method at the given python path, without docstrings."
-                f' If no match is found, then "{NO_RESULT_FOUND_STR}" is returned.\n\n'
-                f'For example - suppose the function "my_function" is defined in the file "my_file.py" located in the main working directory,'
-                f"Then the correct tool input for the parser follows:\n"
-                f"  - tool_args\n"
-                f"    - my_file\n"
-                f"    - None\n"
-                f"    - my_function\n\n"
-                f"Suppose instead the file is located in a subdirectory called my_directory,"
-                f" then the correct tool input for the parser is:\n"
-                f"  - tool_args\n    - my_directory.my_file\n    - my_function\n\n"
-                f"Lastly, if the function is defined in a class, MyClass, then the correct tool input is:\n"
-                f"  - tool_args\n    - my_directory.my_file\n    - MyClass.my_function\n\n",
+                description=_RETRIEVE_CODE_DESCRIPTION,
                 return_direct=True,
                 verbose=True,
             ),
             Tool(
                 name="py-retriever-retrieve-docstring",
                 func=lambda query: self._run_indexer_retrieve_docstring(*query),
-                description=f"Identical to py-retriever-retrieve-code, except returns the docstring instead of raw code.",
+                description=_RETRIEVE_DOCSTRING_DESCRIPTION,
                 return_direct=True,
                 verbose=True,
             ),
             Tool(
                 name="py-retriever-retrieve-raw-code",
                 func=lambda query: self._run_indexer_retrieve_raw_code(*query),
-                description=f"Identical to py-retriever-retrieve-code, except returns the raw text (e.g. code + docstrings) of the module.",
+                description=_RETRIEVE_RAW_CODE_DESCRIPTION,
+                return_direct=True,
+                verbose=True,
+            ),
+            Tool(
+                name="py-retriever-retrieve-code-batch",
+                func=lambda query: "\n".join(
+                    self._run_indexer_retrieve_code_batch(query[0], list(query[1:]))
+                ),
+                description=_RETRIEVE_CODE_BATCH_DESCRIPTION,
                 return_direct=True,
                 verbose=True,
             ),
@@ -98,6 +125,27 @@ class PyCodeRetrieverTool(AgentTool):
         except Exception as e:
             return "Failed to retrieve code with error - " + str(e)
 
+    def _run_indexer_retrieve_code_batch(
+        self, module_path: str, object_paths: List[str]
+    ) -> List[str]:
+        """
+        PythonIndexer retrieves the code of several objects within a
+         single module, without docstrings. The module is parsed and
+         docstring-stripped at most once, so the cost is amortized
+         across all requested objects.
+
+        Args:
+            - module_path (str): The path to the module to retrieve code from.
+            - object_paths (List[str]): The paths to the objects to retrieve code from.
+
+        Returns:
+            - List[str]: The code of each requested object, in input order.
+        """
+        return [
+            self._run_indexer_retrieve_code(module_path, object_path)
+            for object_path in object_paths
+        ]
+
     def _run_indexer_retrieve_docstring(
         self, module_path: str, object_path: Optional[str] = None
     ) -> str:
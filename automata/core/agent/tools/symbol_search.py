@@ -1,15 +1,10 @@
 from enum import Enum
-from typing import List, Optional, Union
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional
 
 from automata.core.agent.tools.agent_tool import AgentTool
 from automata.core.base.tool import Tool
-from automata.core.symbol.search.symbol_search import (
-    ExactSearchResult,
-    SourceCodeResult,
-    SymbolRankResult,
-    SymbolReferencesResult,
-    SymbolSearch,
-)
+from automata.core.symbol.search.symbol_search import SymbolSearch
 
 
 class SearchTool(Enum):
@@ -23,6 +18,24 @@ class SearchTool(Enum):
     EXACT_SEARCH = "exact-search"
 
 
+# Cap on the number of ranked results surfaced through the tool interface
+MAX_RANKED_RESULTS = 100
+
+_TOOL_DESCRIPTIONS: Dict[SearchTool, str] = {
+    SearchTool.SYMBOL_RANK_SEARCH: "Performs a ranked search of symbols based on a given query string.",
+    SearchTool.SYMBOL_REFERENCES: "Finds all the references to a given symbol within the codebase.",
+    SearchTool.RETRIEVE_SOURCE_CODE_BY_SYMBOL: "Returns the source code corresponding to a given symbol.",
+    SearchTool.EXACT_SEARCH: "Performs an exact search for a given pattern across the codebase.",
+}
+
+_TOOL_PROCESSORS: Dict[SearchTool, str] = {
+    SearchTool.SYMBOL_RANK_SEARCH: "_symbol_rank_search_processor",
+    SearchTool.SYMBOL_REFERENCES: "_symbol_symbol_references_processor",
+    SearchTool.RETRIEVE_SOURCE_CODE_BY_SYMBOL: "_retrieve_source_code_by_symbol_processor",
+    SearchTool.EXACT_SEARCH: "_exact_search_processor",
+}
+
+
 class SymbolSearchTool(AgentTool):
     def __init__(
         self,
@@ -36,6 +49,13 @@ class SymbolSearchTool(AgentTool):
         """
         self.symbol_search = symbol_search
         self.search_tools = search_tools or list(SearchTool)
+        # Built once from the configured search tools, so that process_query
+        # avoids re-creating the mapping on every call and rejects tool types
+        # outside the configured set.
+        self._dispatch: Dict[SearchTool, Callable[[str], str]] = {
+            tool_type: getattr(self, _TOOL_PROCESSORS[tool_type])
+            for tool_type in self.search_tools
+        }
 
     def build_tool(self, tool_type: SearchTool) -> Tool:
         """
@@ -47,23 +67,11 @@ class SymbolSearchTool(AgentTool):
         Returns:
             Tool: The built tool.
         """
-        tool_funcs = {
-            SearchTool.SYMBOL_RANK_SEARCH: self._symbol_rank_search_processor,
-            SearchTool.SYMBOL_REFERENCES: self._symbol_symbol_references_processor,
-            SearchTool.RETRIEVE_SOURCE_CODE_BY_SYMBOL: self._retrieve_source_code_by_symbol_processor,
-            SearchTool.EXACT_SEARCH: self._exact_search_processor,
-        }
-        tool_descriptions = {
-            SearchTool.SYMBOL_RANK_SEARCH: "Performs a ranked search of symbols based on a given query string.",
-            SearchTool.SYMBOL_REFERENCES: "Finds all the references to a given symbol within the codebase.",
-            SearchTool.RETRIEVE_SOURCE_CODE_BY_SYMBOL: "Returns the source code corresponding to a given symbol.",
-            SearchTool.EXACT_SEARCH: "Performs an exact search for a given pattern across the codebase.",
-        }
-        if tool_type in tool_funcs:
+        if tool_type in _TOOL_PROCESSORS:
             return Tool(
                 name=tool_type.value,
-                func=tool_funcs[tool_type],
-                description=tool_descriptions[tool_type],
+                func=getattr(self, _TOOL_PROCESSORS[tool_type]),
+                description=_TOOL_DESCRIPTIONS[tool_type],
             )
         raise ValueError(f"Invalid tool type: {tool_type}")
 
@@ -76,9 +84,7 @@ class SymbolSearchTool(AgentTool):
         """
         return [self.build_tool(tool_type) for tool_type in self.search_tools]
 
-    def process_query(
-        self, tool_type: SearchTool, query: str
-    ) -> Union[SymbolReferencesResult, SymbolRankResult, SourceCodeResult, ExactSearchResult,]:
+    def process_query(self, tool_type: SearchTool, query: str) -> str:
         """
         Processes a query using the given tool type.
 
@@ -87,13 +93,27 @@ class SymbolSearchTool(AgentTool):
             query (str): The query to process.
 
         Returns:
-            Union[SymbolReferencesResult, SymbolRankResult, SourceCodeResult, ExactSearchResult]: The result of the query.
+            str: The formatted result of the query.
         """
-        tools_dict = {tool.name: tool.func for tool in self.build()}
-        return tools_dict[tool_type.value](query)
+        if tool_type not in self._dispatch:
+            raise ValueError(f"Invalid tool type: {tool_type}")
+        return self._dispatch[tool_type](query)
 
     # TODO - Cleanup these processors to ensure they behave well.
     # -- Right now these are just simplest implementations I can rattle off
+    def _symbol_rank_search_iter(self, query: str) -> Iterator[str]:
+        """
+        Lazily yields the URIs of the ranked search results for a query.
+
+        Args:
+            query (str): The query string to search for.
+
+        Yields:
+            str: The URI of each result, in rank order.
+        """
+        for symbol, _rank in self.symbol_search.symbol_rank_search(query):
+            yield symbol.uri
+
     def _symbol_rank_search_processor(self, query: str) -> str:
         """
         Performs a ranked search of symbols based on a given query string.
@@ -102,10 +122,9 @@ class SymbolSearchTool(AgentTool):
             query (str): The query string to search for.
 
         Returns:
-            str: The result of the query.
+            str: The result of the query, truncated to MAX_RANKED_RESULTS entries.
         """
-        query_result = self.symbol_search.symbol_rank_search(query)
-        return "\n".join([symbol.uri for symbol, _rank in query_result])
+        return "\n".join(islice(self._symbol_rank_search_iter(query), MAX_RANKED_RESULTS))
 
     def _symbol_symbol_references_processor(self, query: str) -> str:
         """
@@ -118,8 +137,9 @@ class SymbolSearchTool(AgentTool):
             str: The result of the query.
         """
         query_result = self.symbol_search.symbol_references(query)
+        # Generator feed avoids materializing the full list of formatted rows
         return "\n".join(
-            [f"{symbol}:{str(reference)}" for symbol, reference in query_result.items()]
+            "%s:%s" % (symbol, reference) for symbol, reference in query_result.items()
         )
 
     def _retrieve_source_code_by_symbol_processor(self, query: str) -> str:
@@ -147,5 +167,5 @@ class SymbolSearchTool(AgentTool):
         """
         query_result = self.symbol_search.exact_search(query)
         return "\n".join(
-            [f"{symbol}:{str(references)}" for symbol, references in query_result.items()]
+            "%s:%s" % (symbol, references) for symbol, references in query_result.items()
         )
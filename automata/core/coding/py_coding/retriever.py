@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from redbaron import ClassNode, DefNode, Node, RedBaron, StringNode
 
 from automata.core.coding.py_coding.module_tree import LazyModuleTreeMap
 from automata.core.coding.py_coding.navigation import find_syntax_tree_node
-from automata.core.coding.py_coding.py_utils import NO_RESULT_FOUND_STR
+from automata.core.coding.py_coding.py_utils import DOT_SEP, NO_RESULT_FOUND_STR
 
 logger = logging.getLogger(__name__)
 FSTNode = Union[Node, RedBaron]
@@ -20,6 +20,11 @@ class PyCodeRetriever:
         self, module_tree_map: LazyModuleTreeMap = LazyModuleTreeMap.cached_default()
     ) -> None:
         self.module_tree_map = module_tree_map
+        # Docstring-stripped module copies, built at most once per module
+        self._no_docstring_modules: Dict[str, RedBaron] = {}
+        # Qualname -> FST node indices, built at most once per module so that
+        # repeat lookups are a dict probe instead of an FST traversal
+        self._qualname_indices: Dict[Tuple[str, bool], Dict[str, FSTNode]] = {}
 
     def get_source_code(self, module_dotpath: str, object_path: Optional[str] = None) -> str:
         """
@@ -36,7 +41,7 @@ class PyCodeRetriever:
         """
         module = self.module_tree_map.fetch_module(module_dotpath)
         if module:
-            result = find_syntax_tree_node(module, object_path)
+            result = self._find_indexed_node(module_dotpath, module, object_path)
             if result:
                 return result.dumps()
 
@@ -58,7 +63,7 @@ class PyCodeRetriever:
         module = self.module_tree_map.fetch_module(module_dotpath)
         if module:
             return PyCodeRetriever.get_docstring_from_node(
-                find_syntax_tree_node(module, object_path)
+                self._find_indexed_node(module_dotpath, module, object_path)
             )
         return NO_RESULT_FOUND_STR
 
@@ -100,14 +105,88 @@ class PyCodeRetriever:
         module = self.module_tree_map.fetch_module(module_dotpath)
 
         if module:
-            module_copy = RedBaron(module.dumps())
-            result = find_syntax_tree_node(module_copy, object_path)
+            # Copying and stripping the module is the expensive step, so it is
+            # done once per module and reused across object lookups
+            module_copy = self._no_docstring_modules.get(module_dotpath)
+            if module_copy is None:
+                module_copy = RedBaron(module.dumps())
+                _remove_docstrings(module_copy)
+                self._no_docstring_modules[module_dotpath] = module_copy
+            result = self._find_indexed_node(
+                module_dotpath, module_copy, object_path, stripped=True
+            )
 
             if result:
-                _remove_docstrings(result)
                 return result.dumps()
         return NO_RESULT_FOUND_STR
 
+    def invalidate_module(self, module_dotpath: str) -> None:
+        """
+        Drops the cached derivatives of a module after it has been mutated
+
+        Args:
+            module_dotpath (str): The dotpath of the module that changed
+        """
+        self._no_docstring_modules.pop(module_dotpath, None)
+        self._qualname_indices.pop((module_dotpath, False), None)
+        self._qualname_indices.pop((module_dotpath, True), None)
+
+    def _find_indexed_node(
+        self,
+        module_dotpath: str,
+        module: FSTNode,
+        object_path: Optional[str],
+        stripped: bool = False,
+    ) -> Optional[FSTNode]:
+        """
+        Looks up an object in a module via the cached qualname index
+
+        Falls back to a full FST traversal for paths the index does not cover.
+
+        Args:
+            module_dotpath (str): The dotpath of the module being searched
+            module: The module FST object (or its docstring-stripped copy)
+            object_path (Optional[str]): The dot-separated object path, or None for the module
+            stripped (bool): Whether the module is the docstring-stripped copy
+
+        Returns:
+            The found node, or None if not found
+        """
+        if not object_path:
+            return module
+
+        index_key = (module_dotpath, stripped)
+        if index_key not in self._qualname_indices:
+            self._qualname_indices[index_key] = PyCodeRetriever._build_qualname_index(module)
+        node = self._qualname_indices[index_key].get(object_path)
+        if node is None:
+            node = find_syntax_tree_node(module, object_path)
+        return node
+
+    @staticmethod
+    def _build_qualname_index(module: FSTNode) -> Dict[str, FSTNode]:
+        """
+        Builds a map from dot-separated qualnames to def and class nodes
+
+        Args:
+            module: The module FST object to index
+
+        Returns:
+            Dict[str, FSTNode]: The qualname to node index
+        """
+        index: Dict[str, FSTNode] = {}
+        for node in module.find_all(lambda identifier: identifier in ("def", "class")):
+            parts = [node.name]
+            parent = node.parent
+            while parent is not None and not isinstance(parent, RedBaron):
+                if isinstance(parent, (DefNode, ClassNode)):
+                    parts.append(parent.name)
+                parent = parent.parent
+            # setdefault keeps the first definition of a repeated qualname
+            # (e.g. @overload stubs), matching find_syntax_tree_node
+            index.setdefault(DOT_SEP.join(reversed(parts)), node)
+        return index
+
     @staticmethod
     def get_docstring_from_node(node: Optional[FSTNode]) -> str:
         """
@@ -62,6 +62,7 @@ class PyCodeWriter:
             RedBaron: The created module object
         """
         self._create_module_from_source_code(module_dotpath, source_code)
+        self.code_retriever.invalidate_module(module_dotpath)
         if do_write:
             self._write_module_to_disk(module_dotpath)
 
@@ -99,6 +100,7 @@ class PyCodeWriter:
             module_obj,
             disambiguator=disambiguator,
         )
+        self.code_retriever.invalidate_module(module_dotpath)
         if do_write:
             self._write_module_to_disk(module_dotpath)
 
@@ -128,6 +130,7 @@ class PyCodeWriter:
         node = find_syntax_tree_node(module_obj, object_dotpath)
         if node:
             PyCodeWriter._delete_node(node)
+            self.code_retriever.invalidate_module(module_dotpath)
             if do_write:
                 self._write_module_to_disk(module_dotpath)
 
@@ -84,7 +84,7 @@ class PyContextRetriever:
         def indent() -> str:
             return self.config.spacer * self.indent_level
 
-        self.context += "\n".join([f"{indent()}{ele}" for ele in message.split("\n")]) + "\n"
+        self.context += "\n".join(f"{indent()}{ele}" for ele in message.split("\n")) + "\n"
 
     def get_context_buffer(self) -> str:
         """
@@ -324,7 +324,7 @@ class PyContextRetriever:
         """
 
         raw_doctring = PyCodeRetriever.get_docstring_from_node(ast_object).split("\n")
-        return "\n".join([ele.strip() for ele in raw_doctring]).strip()
+        return "\n".join(ele.strip() for ele in raw_doctring).strip()
 
     @staticmethod
     def _pass_symbol_filter(primary_symbol: Symbol, secondary_symbol: Symbol) -> bool:
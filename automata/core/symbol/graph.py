@@ -1,4 +1,6 @@
 import logging
+import os
+import pickle
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from time import time
@@ -701,6 +703,64 @@ class SymbolGraph:
 
         return SymbolGraph.SubGraph(graph=G, parent=self)
 
+    def save(self, path: str) -> None:
+        """
+        Persists the built graph to a binary snapshot on disk
+
+        Args:
+            path (str): The path to write the snapshot to
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self._graph, f, protocol=5)
+
+    @classmethod
+    def load(cls, path: str) -> "SymbolGraph":
+        """
+        Restores a SymbolGraph from a snapshot written by save,
+        skipping the protobuf parse and graph construction
+
+        Args:
+            path (str): The path of the snapshot to load
+
+        Returns:
+            SymbolGraph instance
+        """
+        with open(path, "rb") as f:
+            graph = pickle.load(f)
+        instance = cls.__new__(cls)
+        instance._graph = graph
+        instance.navigator = _SymbolGraphNavigator(graph)
+        return instance
+
+    @classmethod
+    def from_index_cached(cls, index_path: str, cache_path: Optional[str] = None) -> "SymbolGraph":
+        """
+        Builds a SymbolGraph from an index protobuf file, reusing an
+        on-disk snapshot when it is newer than the index
+
+        Args:
+            index_path (str): Path to index protobuf file
+            cache_path (Optional[str]): Path of the snapshot to reuse;
+                defaults to the index path with a .cache suffix
+
+        Returns:
+            SymbolGraph instance
+        """
+        cache_path = cache_path or f"{index_path}.cache"
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(
+            index_path
+        ):
+            try:
+                return cls.load(cache_path)
+            except Exception as e:
+                logger.error(f"Failed to load cached graph '{cache_path}' due to: {e}")
+        graph = cls(index_path)
+        try:
+            graph.save(cache_path)
+        except Exception as e:
+            logger.error(f"Failed to save cached graph '{cache_path}' due to: {e}")
+        return graph
+
     @staticmethod
     def _load_index_protobuf(path: str) -> Index:
         """
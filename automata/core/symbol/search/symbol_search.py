@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
@@ -9,6 +10,7 @@ from automata.core.embedding.symbol_similarity import SymbolSimilarity
 from automata.core.symbol.graph import SymbolGraph
 from automata.core.symbol.parser import parse_symbol
 from automata.core.symbol.search.rank import SymbolRank, SymbolRankConfig
+from automata.core.symbol.search.symbol_trie import SymbolTrie
 from automata.core.symbol.symbol_types import Symbol, SymbolReference
 from automata.core.symbol.symbol_utils import convert_to_fst_object
 
@@ -48,6 +50,7 @@ class SymbolSearch:
 
         # TODO - Do we need to filter the SymbolGraph as well?
         self.symbol_graph = symbol_graph
+        self.symbol_trie = SymbolTrie.from_symbols(available_symbols)
         self.symbol_code_similarity = symbol_code_similarity
         symbol_code_similarity.set_available_symbols(available_symbols)
         self.symbol_rank = SymbolRank(code_subgraph.graph, config=symbol_rank_config)
@@ -95,6 +98,18 @@ class SymbolSearch:
         node = convert_to_fst_object(parse_symbol(symbol_uri))
         return str(node) if node else None
 
+    def prefix_search(self, prefix: str) -> List[Symbol]:
+        """
+        Fetches all available symbols whose URIs fall under the given prefix
+
+        Args:
+            prefix (str): A URI prefix, e.g. a package or module namespace
+
+        Returns:
+            A list of symbols in the namespace
+        """
+        return self.symbol_trie.find_by_prefix(prefix)
+
     def exact_search(self, pattern: str) -> ExactSearchResult:
         """
         Performs a exact search across the indexed codebase
@@ -139,6 +154,25 @@ class SymbolSearch:
         else:
             raise ValueError(f"Unknown search type: {search_type}")
 
+    def process_queries(
+        self, queries: List[str]
+    ) -> List[
+        Union[SymbolReferencesResult, SymbolRankResult, SourceCodeResult, ExactSearchResult]
+    ]:
+        """
+        Processes multiple independent NLP-formatted queries concurrently
+
+        Args:
+            queries: The queries to process
+
+        Returns:
+            The results of each search, ordered to match the input queries
+        """
+        if len(queries) <= 1:
+            return [self.process_query(query) for query in queries]
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(self.process_query, queries))
+
     @staticmethod
     def filter_graph(graph: nx.DiGraph, available_symbols: Set[Symbol]) -> None:
         """
@@ -208,8 +242,48 @@ class SymbolSearch:
         module_map = LazyModuleTreeMap.cached_default()
         for module_path, module in module_map.items():
             if module:
-                lines = module.dumps().splitlines()
-                line_numbers = [i + 1 for i, line in enumerate(lines) if pattern in line.strip()]
+                source = module.dumps()
+                # Coarse substring scan over the whole source runs at C speed;
+                # only modules that hit fall back to the offset-based pass.
+                if pattern not in source:
+                    continue
+                line_numbers = SymbolSearch._find_pattern_in_source(pattern, source)
                 if line_numbers:
                     matches[module_path] = line_numbers
         return matches
+
+    @staticmethod
+    def _find_pattern_in_source(pattern: str, source: str) -> List[int]:
+        """
+        Finds the line numbers of lines whose stripped text contains the pattern
+
+        Walks the source with the C-level str.find instead of splitting the
+        whole module into per-line strings, touching only the lines that
+        actually contain a match.
+
+        Args:
+            pattern (str): The pattern string to search for
+            source (str): The full source text of a module
+
+        Returns:
+            List[int]: The sorted line numbers containing the pattern
+        """
+        line_numbers: List[int] = []
+        line_number = 1
+        count_position = 0
+        search_position = 0
+        while True:
+            match_position = source.find(pattern, search_position)
+            if match_position == -1:
+                break
+            line_number += source.count("\n", count_position, match_position)
+            count_position = match_position
+            line_start = source.rfind("\n", 0, match_position) + 1
+            line_end = source.find("\n", match_position)
+            if line_end == -1:
+                line_end = len(source)
+            line = source[line_start:line_end]
+            if pattern in line.strip() and (not line_numbers or line_numbers[-1] != line_number):
+                line_numbers.append(line_number)
+            search_position = line_end + 1
+        return line_numbers
@@ -0,0 +1,126 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+from automata.core.symbol.symbol_types import Symbol
+
+_COMPONENT_SPLITTER = re.compile(r"[/.]")
+
+
+class SymbolTrieNode:
+    """A single node of a SymbolTrie"""
+
+    __slots__ = ("children", "symbol")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "SymbolTrieNode"] = {}
+        self.symbol: Optional[Symbol] = None
+
+
+class SymbolTrie:
+    """
+    A prefix trie over symbol URIs, keyed on URI path components.
+
+    Symbol URIs share long common prefixes (scheme, package, module path),
+    so storing them component-by-component collapses the shared prefixes
+    into single nodes. Exact lookups descend the trie in O(|uri|) and
+    prefix queries enumerate only the matching subtree, independent of
+    the total number of indexed symbols.
+    """
+
+    def __init__(self) -> None:
+        self._root = SymbolTrieNode()
+
+    def insert(self, symbol: Symbol) -> None:
+        """
+        Inserts a symbol into the trie, keyed by its URI components.
+
+        Args:
+            symbol (Symbol): The symbol to insert.
+        """
+        node = self._root
+        for component in self._tokenize(symbol.uri):
+            node = node.children.setdefault(component, SymbolTrieNode())
+        node.symbol = symbol
+
+    def find_exact(self, uri: str) -> Optional[Symbol]:
+        """
+        Finds the symbol with the given URI, if indexed.
+
+        Args:
+            uri (str): The full URI of the symbol to look up.
+
+        Returns:
+            Optional[Symbol]: The matching symbol, or None if not found.
+        """
+        node = self._descend(uri)
+        return node.symbol if node else None
+
+    def find_by_prefix(self, prefix: str) -> List[Symbol]:
+        """
+        Finds all indexed symbols whose URIs fall under the given prefix.
+
+        Args:
+            prefix (str): A URI prefix, e.g. a package or module namespace.
+
+        Returns:
+            List[Symbol]: All symbols in the subtree rooted at the prefix.
+        """
+        node = self._descend(prefix)
+        if not node:
+            return []
+        symbols: List[Symbol] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.symbol is not None:
+                symbols.append(current.symbol)
+            stack.extend(current.children.values())
+        return symbols
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[Symbol]) -> "SymbolTrie":
+        """
+        Builds a trie from an iterable of symbols.
+
+        Args:
+            symbols (Iterable[Symbol]): The symbols to index.
+
+        Returns:
+            SymbolTrie: The populated trie.
+        """
+        trie = cls()
+        for symbol in symbols:
+            trie.insert(symbol)
+        return trie
+
+    def _descend(self, uri: str) -> Optional[SymbolTrieNode]:
+        """
+        Walks the trie along the components of the given URI.
+
+        Args:
+            uri (str): The URI (or URI prefix) to descend along.
+
+        Returns:
+            Optional[SymbolTrieNode]: The node reached, or None if the path
+                does not exist in the trie.
+        """
+        node = self._root
+        for component in self._tokenize(uri):
+            child = node.children.get(component)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    @staticmethod
+    def _tokenize(uri: str) -> List[str]:
+        """
+        Splits a URI into its path components on '/' and '.'.
+
+        Args:
+            uri (str): The URI to split.
+
+        Returns:
+            List[str]: The non-empty components of the URI.
+        """
+        return [component for component in _COMPONENT_SPLITTER.split(uri) if component]
@@ -215,7 +215,7 @@ class Symbol:
     @property
     def dotpath(self) -> str:
         """Returns the dotpath of the symbol"""
-        return ".".join([ele.name for ele in self.descriptors])
+        return ".".join(ele.name for ele in self.descriptors)
 
     @property
     def module_name(self) -> str:
@@ -291,6 +291,11 @@ class SymbolFile:
     path: str
     occurrences: str
 
+    def __reduce__(self):
+        # occurrences may hold a live protobuf container, which cannot be
+        # pickled; nothing reads it downstream, so serialize its string form
+        return (SymbolFile, (self.path, str(self.occurrences)))
+
     def __hash__(self) -> int:
         return hash(self.path)
 
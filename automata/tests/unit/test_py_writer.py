@@ -387,3 +387,43 @@ def test_write_and_retrieve_mock_code(py_writer):
     root_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_modules")
     fpath = os.path.join(root_dir, "sample_module_2.py")
     os.remove(fpath)
+
+
+def test_update_invalidates_retriever_caches(py_writer):
+    mock_generator = MockCodeGenerator(has_function=True, has_function_docstring=True)
+    source_code = mock_generator.generate_code()
+    py_writer.create_new_module("sample_module_55", source_code)
+
+    # Populate the retriever's docstring-stripped cache before mutating
+    pre_edit_code = py_writer.code_retriever.get_source_code_without_docstrings(
+        "sample_module_55", None
+    )
+    assert mock_generator.function_name in pre_edit_code
+
+    mock_generator_2 = MockCodeGenerator(has_function=True, has_function_docstring=True)
+    source_code_2 = mock_generator_2.generate_code()
+    py_writer.update_existing_module("sample_module_55", source_code_2)
+
+    post_edit_code = py_writer.code_retriever.get_source_code_without_docstrings(
+        "sample_module_55", None
+    )
+    assert mock_generator_2.function_name in post_edit_code
+
+
+def test_delete_invalidates_qualname_index(py_writer):
+    mock_generator = MockCodeGenerator(has_class=True, has_function=True)
+    source_code = mock_generator.generate_code()
+    py_writer.create_new_module("sample_module_56", source_code)
+
+    # Populate the retriever's qualname index before deleting
+    pre_delete_code = py_writer.code_retriever.get_source_code(
+        "sample_module_56", mock_generator.function_name
+    )
+    assert mock_generator.function_name in pre_delete_code
+
+    py_writer.delete_from_existing__module("sample_module_56", mock_generator.function_name)
+
+    assert (
+        py_writer.code_retriever.get_source_code("sample_module_56", mock_generator.function_name)
+        == "No Result Found."
+    )
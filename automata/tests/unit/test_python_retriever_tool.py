@@ -23,7 +23,7 @@ def test_init(python_retriever_tool_builder):
 
 def test_build(python_retriever_tool_builder):
     tools = python_retriever_tool_builder.build()
-    assert len(tools) == 3
+    assert len(tools) == 4
     for tool in tools:
         assert isinstance(tool, Tool)
 
@@ -39,3 +39,15 @@ def test_tool_execution(python_retriever_tool_builder):
     tools = python_retriever_tool_builder.build()
     assert tools[0].func(("module.path", "func")) == "Sample code"
     assert tools[1].func(("module.path", "func")) == "Sample docstring"
+
+
+def test_batch_tool_execution(python_retriever_tool_builder):
+    python_retriever_tool_builder.code_retriever.get_source_code_without_docstrings = MagicMock(
+        side_effect=lambda module_path, object_path: f"code for {object_path}"
+    )
+
+    tools = python_retriever_tool_builder.build()
+    batch_tool = [tool for tool in tools if tool.name == "py-retriever-retrieve-code-batch"][0]
+    assert batch_tool.func(("module.path", "func_a", "func_b")) == (
+        "code for func_a\ncode for func_b"
+    )
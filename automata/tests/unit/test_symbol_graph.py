@@ -28,3 +28,15 @@ def test_build_real_graph_and_subgraph(symbol_graph_static_test):  # noqa: F811
     assert len(all_files) == 91
     assert len(subgraph.graph) == 71
     assert subgraph.graph.number_of_edges() == 208
+
+
+def test_save_and_load_roundtrip(symbol_graph_static_test, tmp_path):  # noqa: F811
+    snapshot_path = str(tmp_path / "index.scip.cache")
+    symbol_graph_static_test.save(snapshot_path)
+    loaded = SymbolGraph.load(snapshot_path)
+
+    assert isinstance(loaded, SymbolGraph)
+    assert set(loaded.get_all_available_symbols()) == set(
+        symbol_graph_static_test.get_all_available_symbols()
+    )
+    assert len(loaded.get_all_files()) == len(symbol_graph_static_test.get_all_files())
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from automata.core.symbol.parser import parse_symbol
+from automata.core.symbol.search.symbol_search import SymbolSearch
 
 
 def test_retrieve_source_code_by_symbol(symbols, symbol_searcher):
@@ -65,3 +66,23 @@ def test_process_queries(symbols, symbol_searcher, symbol_graph_mock):
 
     with pytest.raises(ValueError):
         symbol_searcher.process_query("type:unknown query")
+
+
+def test_process_queries_concurrent(symbols, symbol_searcher):
+    with patch.object(
+        symbol_searcher, "symbol_references", return_value=["ref1", "ref2"]
+    ), patch.object(symbol_searcher, "exact_search", return_value={"test": 0}):
+        results = symbol_searcher.process_queries(
+            [
+                "type:symbol_references %s" % symbols[0].uri,
+                "type:exact pattern1",
+            ]
+        )
+    assert results == [["ref1", "ref2"], {"test": 0}]
+
+
+def test_find_pattern_in_source():
+    source = "def foo():\n    return bar\n\nbar = 1\n"
+    assert SymbolSearch._find_pattern_in_source("bar", source) == [2, 4]
+    assert SymbolSearch._find_pattern_in_source("baz", source) == []
+    assert SymbolSearch._find_pattern_in_source("foo", source) == [1]
@@ -0,0 +1,28 @@
+from automata.core.symbol.search.symbol_trie import SymbolTrie
+
+
+def test_find_exact(symbols):
+    trie = SymbolTrie.from_symbols(symbols)
+    for symbol in symbols:
+        assert trie.find_exact(symbol.uri) == symbol
+
+
+def test_find_exact_missing(symbols):
+    trie = SymbolTrie.from_symbols(symbols)
+    assert (
+        trie.find_exact("scip-python python automata 0000 `nonexistent.module`/Missing#") is None
+    )
+
+
+def test_find_by_prefix(symbols):
+    trie = SymbolTrie.from_symbols(symbols)
+    prefix = "scip-python python automata 75482692a6fe30c72db516201a6f47d9fb4af065 `config.automata_agent_config`"
+    results = trie.find_by_prefix(prefix)
+    expected = {symbol for symbol in symbols if symbol.uri.startswith(prefix)}
+    assert set(results) == expected
+    assert len(expected) > 0
+
+
+def test_find_by_prefix_missing(symbols):
+    trie = SymbolTrie.from_symbols(symbols)
+    assert trie.find_by_prefix("scip-python python automata 0000 `nonexistent.module`") == []